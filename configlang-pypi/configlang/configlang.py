@@ -14,10 +14,24 @@ Example usage:
 """
 
 import ctypes
+import functools
+import hashlib
 import os
-from typing import Optional, Union
+import struct
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 from pathlib import Path
 
+try:
+    from .configlang_fast import FastBinding as _FastBinding
+except ImportError:
+    # Compiled fast path not built (or running as a script): ctypes only
+    _FastBinding = None
+
 
 # Error codes (matching C library)
 ERR_CFG_OK = 0
@@ -30,6 +44,42 @@ ERR_CFG_OUT_OF_MEMORY = -6
 ERR_CFG_TYPE_MISMATCH = -7
 ERR_CFG_UNKNOWN_ERROR = -8
 
+# Variable types (matching C library)
+CFG_TYPE_INT = 0
+CFG_TYPE_STRING = 1
+
+# Size of a string value slot in the C library, including the terminator
+_MAX_STRING_VALUE = 1024
+
+# Library paths found by ConfigLang._find_library, keyed by search paths
+_LIB_PATH_CACHE = {}
+
+# Variable names are looked up repeatedly, so reuse their encoded bytes.
+# The cache is shared by all instances: names rarely differ between them.
+_encode_name = functools.lru_cache(maxsize=1024)(str.encode)
+
+# Error messages come from a small fixed set, so reuse their decoded form
+# (messages embedding a long variable name may be cut mid UTF-8 sequence)
+_decode_error = functools.lru_cache(maxsize=128)(
+    functools.partial(bytes.decode, encoding='utf-8', errors='replace')
+)
+
+# Snapshots of freshly parsed configurations, keyed by a hash of the source
+_PARSE_CACHE_SIZE = 128
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Files below _SMALL_FILE_SIZE are read by the C library itself; larger
+# ones in 128 KiB chunks (the old 8 KiB default costs far more syscalls)
+_SMALL_FILE_SIZE = 64 * 1024
+_READ_CHUNK_SIZE = 128 * 1024
+
+# On-disk parse cache: '<path>.cfgc' holds a header identifying the source
+# file (st_mtime_ns, st_size) followed by the snapshot of its parsed state
+_DISK_CACHE_SUFFIX = '.cfgc'
+_DISK_CACHE_MAGIC = b'CFGC\x00\x00\x00\x01'
+_DISK_CACHE_HEADER = struct.Struct('<8sqq8x')
+
 
 class ConfigLangError(Exception):
     """Base exception for ConfigLang errors"""
@@ -56,6 +106,139 @@ class TypeMismatchError(ConfigLangError):
     pass
 
 
+class _CfgExport(ctypes.Structure):
+    """Mirror of the C CfgExport struct filled by cfg_export"""
+    _fields_ = [
+        ('count', ctypes.c_int),
+        ('names', ctypes.c_void_p),
+        ('names_len', ctypes.c_size_t),
+        ('types', ctypes.POINTER(ctypes.c_int)),
+        ('ints', ctypes.POINTER(ctypes.c_int)),
+        ('str_offsets', ctypes.POINTER(ctypes.c_size_t)),
+        ('strs', ctypes.c_void_p),
+        ('strs_len', ctypes.c_size_t),
+    ]
+
+
+_c_void_p = ctypes.c_void_p
+_c_char_p = ctypes.c_char_p
+_c_int = ctypes.c_int
+_c_size_t = ctypes.c_size_t
+_c_int_p = ctypes.POINTER(ctypes.c_int)
+_c_char_p_p = ctypes.POINTER(ctypes.c_char_p)
+
+# C function signatures: (name, argtypes, restype)
+_SIGNATURES = (
+    ('cfg_create', [], _c_void_p),
+    ('cfg_destroy', [_c_void_p], None),
+    ('cfg_load_file', [_c_void_p, _c_char_p], _c_int),
+    ('cfg_load_string', [_c_void_p, _c_char_p], _c_int),
+    ('cfg_get_int', [_c_void_p, _c_char_p, _c_int_p], _c_int),
+    ('cfg_get_string', [_c_void_p, _c_char_p, _c_char_p_p], _c_int),
+    ('cfg_set_int', [_c_void_p, _c_char_p, _c_int], _c_int),
+    ('cfg_save_file', [_c_void_p, _c_char_p], _c_int),
+    ('cfg_get_error', [_c_void_p], _c_char_p),
+)
+
+# Functions that older builds of the library lack; they are configured
+# only if exported and callers check for them before use
+_OPTIONAL_SIGNATURES = (
+    ('cfg_snapshot_size', [_c_void_p], _c_size_t),
+    ('cfg_save_snapshot', [_c_void_p, _c_char_p, _c_size_t], _c_int),
+    ('cfg_load_snapshot', [_c_void_p, _c_char_p, _c_size_t], _c_int),
+    ('cfg_has', [_c_void_p, _c_char_p], _c_int),
+    ('cfg_get_any', [_c_void_p, _c_char_p, _c_int_p, _c_int_p, _c_char_p_p], _c_int),
+    ('cfg_set_string', [_c_void_p, _c_char_p, _c_char_p], _c_int),
+    ('cfg_get_many', [_c_void_p, _c_char_p, _c_int, _c_int_p, _c_int_p, _c_char_p_p], _c_int),
+    ('cfg_set_many', [_c_void_p, _c_char_p, _c_int, _c_int_p], _c_int),
+    ('cfg_export', [_c_void_p, ctypes.POINTER(_CfgExport)], _c_int),
+    ('cfg_export_free', [ctypes.POINTER(_CfgExport)], None),
+)
+
+
+def _configure_lib(lib: ctypes.CDLL) -> None:
+    """Setup C function signatures using ctypes"""
+    for name, argtypes, restype in _SIGNATURES:
+        func = getattr(lib, name)
+        func.argtypes = argtypes
+        func.restype = restype
+    
+    for name, argtypes, restype in _OPTIONAL_SIGNATURES:
+        func = getattr(lib, name, None)
+        if func is not None:
+            func.argtypes = argtypes
+            func.restype = restype
+
+
+@functools.lru_cache(maxsize=None)
+def _load_lib(lib_path: str) -> ctypes.CDLL:
+    """
+    Load the shared library and setup its function signatures.
+    
+    Handles are cached per path, so creating many ConfigLang instances
+    only loads and configures the library once.
+    """
+    # CDLL (unlike PyDLL) releases the GIL for the duration of every call
+    lib = ctypes.CDLL(lib_path)
+    _configure_lib(lib)
+    return lib
+
+
+def _read_chunked(path: Union[str, Path]) -> bytearray:
+    """
+    Read a large file into a single NUL-terminated buffer.
+    
+    The buffer is sized from fstat() up front and filled with readinto() in
+    _READ_CHUNK_SIZE chunks, so no intermediate copies are made.
+    """
+    with open(path, 'rb', buffering=0) as f:
+        data = bytearray(os.fstat(f.fileno()).st_size + 1)
+        pos = 0
+        while True:
+            if pos == len(data) - 1:
+                # Buffer is full: only grow it if the file grew since fstat()
+                extra = f.read(1)
+                if not extra:
+                    break
+                data[pos] = extra[0]
+                pos += 1
+                data.extend(bytes(_READ_CHUNK_SIZE))
+            with memoryview(data) as view:
+                count = f.readinto(view[pos:min(pos + _READ_CHUNK_SIZE, len(data) - 1)])
+            if not count:
+                break
+            pos += count
+    
+    del data[pos + 1:]
+    data[pos] = 0
+    return data
+
+
+def _raise_error(error_code: int, raw_msg: bytes) -> None:
+    """
+    Raise the exception matching a C error code.
+    
+    Args:
+        error_code: Non-zero return code from C function
+        raw_msg: Error message as returned by cfg_get_error
+        
+    Raises:
+        Appropriate ConfigLangError subclass based on error code
+    """
+    error_msg = _decode_error(raw_msg)
+    
+    if error_code == ERR_CFG_PARSE_ERROR:
+        raise ParseError(error_msg)
+    elif error_code == ERR_CFG_VARIABLE_NOT_FOUND:
+        raise VariableNotFoundError(error_msg)
+    elif error_code == ERR_CFG_CONST_VIOLATION:
+        raise ConstViolationError(error_msg)
+    elif error_code == ERR_CFG_TYPE_MISMATCH:
+        raise TypeMismatchError(error_msg)
+    else:
+        raise ConfigLangError(f"Error {error_code}: {error_msg}")
+
+
 class ConfigLang:
     """
     Python wrapper for ConfigLang C library.
@@ -63,6 +246,13 @@ class ConfigLang:
     This class provides a Pythonic interface to the embedded configuration
     language, handling memory management and error handling automatically.
     
+    Instances are not thread-safe: the C state and the scratch buffers used
+    for output parameters are shared by all calls on the same instance.
+    Use one instance per thread, or guard a shared instance with a lock.
+    Separate instances can be used concurrently: the library keeps no global
+    state and ctypes releases the GIL during each C call, so load_file,
+    load_string and save_file on different instances run in parallel.
+    
     Attributes:
         _lib: The loaded C library
         _cfg: Pointer to the C ConfigLang structure
@@ -88,18 +278,77 @@ class ConfigLang:
         if not os.path.exists(lib_path):
             raise FileNotFoundError(f"ConfigLang library not found: {lib_path}")
         
-        self._lib = ctypes.CDLL(lib_path)
-        self._setup_functions()
-        
-        # Create ConfigLang instance
-        self._cfg = self._lib.cfg_create()
+        self._lib = _load_lib(lib_path)
+        self._has_snapshots = hasattr(self._lib, 'cfg_save_snapshot')
+        self._has_batch = hasattr(self._lib, 'cfg_get_many')
+        self._has_get_any = hasattr(self._lib, 'cfg_get_any')
+        self._has_export = hasattr(self._lib, 'cfg_export')
+        self._has_cfg_has = hasattr(self._lib, 'cfg_has')
+        self._has_set_string = hasattr(self._lib, 'cfg_set_string')
+        
+        # Create ConfigLang instance. The handle is kept as a c_void_p so
+        # ctypes can pass it through as-is instead of converting a Python
+        # int on every call.
+        self._cfg = ctypes.c_void_p(self._lib.cfg_create())
         if not self._cfg:
             raise ConfigLangError("Failed to create ConfigLang instance")
+        
+        # Parsed state only depends on the source while nothing is loaded yet
+        self._is_empty = True
+        
+        # Reusable output parameters for the getters
+        self._scratch_type = ctypes.c_int()
+        self._scratch_type_ref = ctypes.byref(self._scratch_type)
+        self._scratch_int = ctypes.c_int()
+        self._scratch_int_ref = ctypes.byref(self._scratch_int)
+        self._scratch_str = ctypes.c_char_p()
+        self._scratch_str_ref = ctypes.byref(self._scratch_str)
+        
+        # Hot accessors go through the compiled fast path when it is built
+        self._fast = None
+        if _FastBinding is not None:
+            self._bind_fast()
+        
+        # Destroys the C instance exactly once, at exit or on garbage
+        # collection. With the fast path, the bound accessors only reference
+        # the binding, so the C instance must live as long as the binding does.
+        owner = self if self._fast is None else self._fast
+        self._finalizer = weakref.finalize(owner, self._lib.cfg_destroy, self._cfg)
     
-    def __del__(self):
-        """Cleanup when object is destroyed"""
-        if hasattr(self, '_cfg') and self._cfg:
-            self._lib.cfg_destroy(self._cfg)
+    def _bind_fast(self):
+        """
+        Route get_int, get_string, set_int and get through configlang_fast.
+        
+        Methods overridden by a subclass keep their override (and reach the
+        ctypes implementation through super()).
+        
+        The extension calls the functions of the already loaded library by
+        address, so it works with any build of the library and skips the
+        ctypes argument conversion on every call.
+        """
+        def address(func):
+            return ctypes.cast(func, ctypes.c_void_p).value
+        
+        lib = self._lib
+        get_any = address(lib.cfg_get_any) if self._has_get_any else 0
+        self._fast = _FastBinding(
+            self._cfg.value,
+            address(lib.cfg_get_int),
+            address(lib.cfg_get_string),
+            get_any,
+            address(lib.cfg_set_int),
+            address(lib.cfg_get_error),
+            lib.cfg_set_int,
+            _raise_error,
+        )
+        # Bound on the instance, so skip any method a subclass overrides
+        accessors = ['get_int', 'get_string', 'set_int']
+        if get_any:
+            accessors.append('get')
+        cls = type(self)
+        for name in accessors:
+            if getattr(cls, name) is getattr(ConfigLang, name):
+                setattr(self, name, getattr(self._fast, name))
     
     def __enter__(self):
         """Context manager entry"""
@@ -107,9 +356,10 @@ class ConfigLang:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        if self._cfg:
-            self._lib.cfg_destroy(self._cfg)
-            self._cfg = None
+        if self._fast is not None:
+            self._fast.close()
+        self._finalizer()
+        self._cfg = None
         return False
     
     def _find_library(self) -> str:
@@ -143,55 +393,34 @@ class ConfigLang:
             '/usr/lib',
         ]
         
+        cache_key = tuple(search_paths)
+        lib_path = _LIB_PATH_CACHE.get(cache_key)
+        if lib_path is not None:
+            return lib_path
+        
+        # One directory listing per location instead of a stat per candidate
+        targets = set(lib_names)
         for path in search_paths:
+            try:
+                with os.scandir(path) as entries:
+                    found = {
+                        entry.name: entry.path
+                        for entry in entries
+                        if entry.name in targets and entry.is_file()
+                    }
+            except OSError:
+                continue
+            
             for lib_name in lib_names:
-                lib_path = os.path.join(path, lib_name)
-                if os.path.exists(lib_path):
-                    return lib_path
+                if lib_name in found:
+                    _LIB_PATH_CACHE[cache_key] = found[lib_name]
+                    return found[lib_name]
         
         raise FileNotFoundError(
             f"ConfigLang library not found. Searched for {lib_names} in {search_paths}. "
             "Please compile the C library and specify its path."
         )
     
-    def _setup_functions(self):
-        """Setup C function signatures using ctypes"""
-        # cfg_create
-        self._lib.cfg_create.argtypes = []
-        self._lib.cfg_create.restype = ctypes.c_void_p
-        
-        # cfg_destroy
-        self._lib.cfg_destroy.argtypes = [ctypes.c_void_p]
-        self._lib.cfg_destroy.restype = None
-        
-        # cfg_load_file
-        self._lib.cfg_load_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-        self._lib.cfg_load_file.restype = ctypes.c_int
-        
-        # cfg_load_string
-        self._lib.cfg_load_string.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-        self._lib.cfg_load_string.restype = ctypes.c_int
-        
-        # cfg_get_int
-        self._lib.cfg_get_int.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_int)]
-        self._lib.cfg_get_int.restype = ctypes.c_int
-        
-        # cfg_get_string
-        self._lib.cfg_get_string.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_char_p)]
-        self._lib.cfg_get_string.restype = ctypes.c_int
-        
-        # cfg_set_int
-        self._lib.cfg_set_int.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_int]
-        self._lib.cfg_set_int.restype = ctypes.c_int
-        
-        # cfg_save_file
-        self._lib.cfg_save_file.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
-        self._lib.cfg_save_file.restype = ctypes.c_int
-        
-        # cfg_get_error
-        self._lib.cfg_get_error.argtypes = [ctypes.c_void_p]
-        self._lib.cfg_get_error.restype = ctypes.c_char_p
-    
     def _check_error(self, error_code: int):
         """
         Check error code and raise appropriate exception if needed.
@@ -205,38 +434,112 @@ class ConfigLang:
         if error_code == ERR_CFG_OK:
             return
         
-        error_msg = self.get_error()
-        
-        if error_code == ERR_CFG_PARSE_ERROR:
-            raise ParseError(error_msg)
-        elif error_code == ERR_CFG_VARIABLE_NOT_FOUND:
-            raise VariableNotFoundError(error_msg)
-        elif error_code == ERR_CFG_CONST_VIOLATION:
-            raise ConstViolationError(error_msg)
-        elif error_code == ERR_CFG_TYPE_MISMATCH:
-            raise TypeMismatchError(error_msg)
-        else:
-            raise ConfigLangError(f"Error {error_code}: {error_msg}")
+        _raise_error(error_code, self._lib.cfg_get_error(self._cfg))
     
-    def load_file(self, path: Union[str, Path]) -> None:
+    def load_file(self, path: Union[str, Path], enable_disk_cache: bool = False) -> None:
         """
         Load and execute configuration from a file.
         
         Args:
             path: Path to the configuration file
+            enable_disk_cache: If True and the instance is still empty, keep
+                the parsed state in '<path>.cfgc' and reuse it on later loads
+                while the file's modification time and size are unchanged.
+                Pays off from roughly ten variables upward; tiny files parse
+                faster than the cache can be read
             
         Raises:
             ParseError: If parsing fails
             ConfigLangError: For other errors
         """
-        path_str = str(path).encode('utf-8')
-        result = self._lib.cfg_load_file(self._cfg, path_str)
+        if enable_disk_cache and self._is_empty and self._has_snapshots:
+            self._load_file_cached(path)
+            return
+        
+        result = self._load_read(path)
+        self._is_empty = False
         self._check_error(result)
     
+    def _load_read(self, path: Union[str, Path]) -> int:
+        """
+        Read a file and parse it.
+        
+        Small files are left to cfg_load_file, which beats any Python-side
+        read at that size; larger ones are read in chunks and parsed as a
+        string. Files are never parsed from a memory map: a concurrent
+        truncation would kill the process with SIGBUS.
+        
+        Returns:
+            The C result code
+        """
+        try:
+            if os.stat(path).st_size < _SMALL_FILE_SIZE:
+                return self._lib.cfg_load_file(self._cfg, os.fsencode(path))
+            data = _read_chunked(path)
+        except OSError:
+            # Let the C library report the error as it always has
+            return self._lib.cfg_load_file(self._cfg, os.fsencode(path))
+        
+        buf = (ctypes.c_char * len(data)).from_buffer(data)
+        result = self._lib.cfg_load_string(self._cfg, buf)
+        del buf
+        return result
+    
+    def _load_file_cached(self, path: Union[str, Path]) -> None:
+        """Load a file through its '<path>.cfgc' snapshot cache"""
+        cache_path = os.fspath(path) + _DISK_CACHE_SUFFIX
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        
+        if st is not None:
+            header = _DISK_CACHE_HEADER.pack(_DISK_CACHE_MAGIC, st.st_mtime_ns, st.st_size)
+            try:
+                with open(cache_path, 'rb') as f:
+                    if f.read(_DISK_CACHE_HEADER.size) == header:
+                        snapshot = f.read()
+                        result = self._lib.cfg_load_snapshot(self._cfg, snapshot, len(snapshot))
+                        if result == ERR_CFG_OK:
+                            self._is_empty = False
+                            return
+            except OSError:
+                pass
+        
+        # Cache miss, stale or unreadable: parse the file normally
+        self.load_file(path)
+        
+        # Don't cache if the file changed while it was being parsed
+        try:
+            st_after = os.stat(path)
+        except OSError:
+            return
+        if st is None or (st_after.st_mtime_ns, st_after.st_size) != (st.st_mtime_ns, st.st_size):
+            return
+        
+        snapshot = self._save_snapshot()
+        # Unique per process and thread so concurrent writers never share it
+        tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(header)
+                f.write(snapshot)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # The cache is best-effort (e.g. read-only config directories)
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    
     def load_string(self, code: str) -> None:
         """
         Load and execute configuration from a string.
         
+        While the instance is still empty, the parsed result is cached by a
+        hash of the source, so loading the same code again restores the
+        cached state instead of re-parsing it.
+        
         Args:
             code: Configuration code as a string
             
@@ -245,8 +548,44 @@ class ConfigLang:
             ConfigLangError: For other errors
         """
         code_bytes = code.encode('utf-8')
+        
+        key = None
+        if self._is_empty and self._has_snapshots:
+            key = hashlib.blake2b(code_bytes, digest_size=16).digest()
+            with _PARSE_CACHE_LOCK:
+                snapshot = _PARSE_CACHE.get(key)
+                if snapshot is not None:
+                    _PARSE_CACHE.move_to_end(key)
+            if snapshot is not None:
+                result = self._lib.cfg_load_snapshot(self._cfg, snapshot, len(snapshot))
+                self._check_error(result)
+                self._is_empty = False
+                return
+        
         result = self._lib.cfg_load_string(self._cfg, code_bytes)
+        self._is_empty = False
         self._check_error(result)
+        
+        if key is not None:
+            snapshot = self._save_snapshot()
+            with _PARSE_CACHE_LOCK:
+                _PARSE_CACHE[key] = snapshot
+                if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                    _PARSE_CACHE.popitem(last=False)
+    
+    def _save_snapshot(self) -> bytes:
+        """Serialize the current state using the C snapshot functions"""
+        size = self._lib.cfg_snapshot_size(self._cfg)
+        buf = ctypes.create_string_buffer(size)
+        result = self._lib.cfg_save_snapshot(self._cfg, buf, size)
+        self._check_error(result)
+        return buf.raw
+    
+    @staticmethod
+    def clear_parse_cache() -> None:
+        """Drop all cached parse results shared by ConfigLang instances"""
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE.clear()
     
     def get_int(self, name: str) -> int:
         """
@@ -262,11 +601,10 @@ class ConfigLang:
             VariableNotFoundError: If variable doesn't exist
             TypeMismatchError: If variable is not an integer
         """
-        name_bytes = name.encode('utf-8')
-        value = ctypes.c_int()
-        result = self._lib.cfg_get_int(self._cfg, name_bytes, ctypes.byref(value))
+        name_bytes = _encode_name(name)
+        result = self._lib.cfg_get_int(self._cfg, name_bytes, self._scratch_int_ref)
         self._check_error(result)
-        return value.value
+        return self._scratch_int.value
     
     def get_string(self, name: str) -> str:
         """
@@ -282,11 +620,10 @@ class ConfigLang:
             VariableNotFoundError: If variable doesn't exist
             TypeMismatchError: If variable is not a string
         """
-        name_bytes = name.encode('utf-8')
-        value = ctypes.c_char_p()
-        result = self._lib.cfg_get_string(self._cfg, name_bytes, ctypes.byref(value))
+        name_bytes = _encode_name(name)
+        result = self._lib.cfg_get_string(self._cfg, name_bytes, self._scratch_str_ref)
         self._check_error(result)
-        return value.value.decode('utf-8')
+        return self._scratch_str.value.decode('utf-8')
     
     def set_int(self, name: str, value: int) -> None:
         """
@@ -301,10 +638,38 @@ class ConfigLang:
             ConstViolationError: If variable is const
             TypeMismatchError: If variable is not an integer
         """
-        name_bytes = name.encode('utf-8')
+        name_bytes = _encode_name(name)
         result = self._lib.cfg_set_int(self._cfg, name_bytes, value)
         self._check_error(result)
     
+    def set_string(self, name: str, value: str) -> None:
+        """
+        Set the string value of a variable.
+        
+        Args:
+            name: Variable name
+            value: New string value
+            
+        Raises:
+            VariableNotFoundError: If variable doesn't exist
+            ConstViolationError: If variable is const
+            TypeMismatchError: If variable is not a string
+            ValueError: If value contains NUL or is 1024 bytes or longer in UTF-8
+            ConfigLangError: If the loaded library doesn't provide cfg_set_string
+        """
+        if not self._has_set_string:
+            raise ConfigLangError("set_string() requires a library build with cfg_set_string")
+        
+        value_bytes = value.encode('utf-8')
+        if len(value_bytes) >= _MAX_STRING_VALUE:
+            raise ValueError(f"String value too long ({len(value_bytes)} bytes, limit {_MAX_STRING_VALUE - 1})")
+        if b'\0' in value_bytes:
+            raise ValueError("String values must not contain NUL characters")
+        
+        name_bytes = _encode_name(name)
+        result = self._lib.cfg_set_string(self._cfg, name_bytes, value_bytes)
+        self._check_error(result)
+    
     def save_file(self, path: Union[str, Path]) -> None:
         """
         Save current configuration state to a file.
@@ -315,7 +680,7 @@ class ConfigLang:
         Raises:
             ConfigLangError: If save fails
         """
-        path_str = str(path).encode('utf-8')
+        path_str = os.fsencode(path)
         result = self._lib.cfg_save_file(self._cfg, path_str)
         self._check_error(result)
     
@@ -327,14 +692,12 @@ class ConfigLang:
             Error message string
         """
         error_msg = self._lib.cfg_get_error(self._cfg)
-        return error_msg.decode('utf-8')
+        return _decode_error(error_msg)
     
     def get(self, name: str) -> Union[int, str]:
         """
         Get a variable value (auto-detects type).
         
-        Attempts to get as integer first, falls back to string.
-        
         Args:
             name: Variable name
             
@@ -344,10 +707,125 @@ class ConfigLang:
         Raises:
             VariableNotFoundError: If variable doesn't exist
         """
-        try:
-            return self.get_int(name)
-        except TypeMismatchError:
+        if not self._has_get_any:
+            # Older library builds: try integer first, fall back to string.
+            # The type mismatch is checked on the result code directly so no
+            # error message is fetched or exception raised for strings.
+            name_bytes = _encode_name(name)
+            result = self._lib.cfg_get_int(self._cfg, name_bytes, self._scratch_int_ref)
+            if result == ERR_CFG_OK:
+                return self._scratch_int.value
+            if result != ERR_CFG_TYPE_MISMATCH:
+                self._check_error(result)
             return self.get_string(name)
+        
+        name_bytes = _encode_name(name)
+        result = self._lib.cfg_get_any(
+            self._cfg, name_bytes,
+            self._scratch_type_ref, self._scratch_int_ref, self._scratch_str_ref,
+        )
+        self._check_error(result)
+        if self._scratch_type.value == CFG_TYPE_INT:
+            return self._scratch_int.value
+        return self._scratch_str.value.decode('utf-8')
+    
+    def get_many(self, names: List[str]) -> List[Union[int, str]]:
+        """
+        Get several variable values (auto-detects types) in one C call.
+        
+        Args:
+            names: Variable names
+            
+        Returns:
+            Variable values, in the same order as names
+            
+        Raises:
+            VariableNotFoundError: If any variable doesn't exist
+            ValueError: If any name contains a NUL character
+        """
+        if not self._has_batch:
+            return [self.get(name) for name in names]
+        
+        count = len(names)
+        names_blob = b'\0'.join(map(_encode_name, names))
+        if count and names_blob.count(b'\0') != count - 1:
+            raise ValueError("Variable names must not contain NUL characters")
+        types = (ctypes.c_int * count)()
+        ints = (ctypes.c_int * count)()
+        strs = (ctypes.c_char_p * count)()
+        result = self._lib.cfg_get_many(self._cfg, names_blob, count, types, ints, strs)
+        self._check_error(result)
+        return [
+            value if kind == CFG_TYPE_INT else string.decode('utf-8')
+            for kind, value, string in zip(types, ints, strs)
+        ]
+    
+    def set_many(self, items: Dict[str, int]) -> None:
+        """
+        Set several integer variables in one C call.
+        
+        Either all variables are updated or, on error, none of them.
+        
+        Args:
+            items: Mapping of variable names to new integer values
+            
+        Raises:
+            VariableNotFoundError: If any variable doesn't exist
+            ConstViolationError: If any variable is const
+            TypeMismatchError: If any variable is not an integer
+            ValueError: If any name contains a NUL character
+        """
+        for value in items.values():
+            if not isinstance(value, int):
+                raise TypeError("Only integer values are supported via set_many")
+        
+        if not self._has_batch:
+            for name, value in items.items():
+                self.set_int(name, value)
+            return
+        
+        count = len(items)
+        names_blob = b'\0'.join(map(_encode_name, items))
+        if count and names_blob.count(b'\0') != count - 1:
+            raise ValueError("Variable names must not contain NUL characters")
+        values = (ctypes.c_int * count)(*items.values())
+        result = self._lib.cfg_set_many(self._cfg, names_blob, count, values)
+        self._check_error(result)
+    
+    def as_dict(self) -> Dict[str, Union[int, str]]:
+        """
+        Get all variables and their values in one C call.
+        
+        Returns:
+            Dictionary mapping variable names to values (int or str)
+            
+        Raises:
+            ConfigLangError: If the loaded library doesn't provide cfg_export
+        """
+        if not self._has_export:
+            raise ConfigLangError("as_dict() requires a library build with cfg_export")
+        
+        exp = _CfgExport()
+        result = self._lib.cfg_export(self._cfg, ctypes.byref(exp))
+        self._check_error(result)
+        try:
+            count = exp.count
+            if count == 0:
+                return {}
+            names = ctypes.string_at(exp.names, exp.names_len).split(b'\0')
+            strs = ctypes.string_at(exp.strs, exp.strs_len) if exp.strs_len else b''
+            types = exp.types[:count]
+            ints = exp.ints[:count]
+            offsets = exp.str_offsets[:count + 1]
+            return {
+                names[i].decode('utf-8'): (
+                    ints[i] if types[i] == CFG_TYPE_INT
+                    else strs[offsets[i]:offsets[i + 1]].decode('utf-8')
+                )
+                for i in range(count)
+            }
+        finally:
+            self._lib.cfg_export_free(ctypes.byref(exp))
     
     def __getitem__(self, name: str) -> Union[int, str]:
         """
@@ -361,19 +839,55 @@ class ConfigLang:
         """
         return self.get(name)
     
-    def __setitem__(self, name: str, value: int):
+    def __contains__(self, name: str) -> bool:
+        """
+        Check whether a variable exists ('name in cfg').
+        
+        Cheaper than catching VariableNotFoundError from cfg[name], since no
+        exception is created.
+        
+        Args:
+            name: Variable name
+            
+        Returns:
+            True if the variable exists
+        """
+        if not isinstance(name, str):
+            return False
+        name_bytes = _encode_name(name)
+        if self._has_cfg_has:
+            return bool(self._lib.cfg_has(self._cfg, name_bytes))
+        result = self._lib.cfg_get_int(self._cfg, name_bytes, self._scratch_int_ref)
+        return result in (ERR_CFG_OK, ERR_CFG_TYPE_MISMATCH)
+    
+    # Setter method names for __setitem__, keyed by exact value type
+    _SETTERS = {
+        int: 'set_int',
+        bool: 'set_int',
+        str: 'set_string',
+    }
+    
+    def __setitem__(self, name: str, value: Union[int, str]):
         """
         Dictionary-style setting of variables.
         
-        Currently only supports integers.
+        Supports integers (including bools) and strings.
         
         Args:
             name: Variable name
             value: New value
         """
-        if not isinstance(value, int):
-            raise TypeError("Only integer values are supported via setitem")
-        self.set_int(name, value)
+        setter = self._SETTERS.get(type(value))
+        if setter is None:
+            # Subclasses of supported types (e.g. IntEnum) take the slow path
+            setter = next(
+                (self._SETTERS[base] for base in type(value).__mro__ if base in self._SETTERS),
+                None,
+            )
+            if setter is None:
+                raise TypeError("Only integer and string values are supported via setitem")
+        # Looked up on the instance so the fast path's setters are used
+        getattr(self, setter)(name, value)
 
 
 def main():
@@ -417,6 +931,77 @@ def main():
     # Save configuration
     cfg.save_file('python_test.cfg')
     print(f"\n✓ Saved to python_test.cfg")
+    
+    # On-disk parse cache
+    print(f"\nDisk cache:")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cached.cfg')
+        cache_path = path + _DISK_CACHE_SUFFIX
+        with open(path, 'w') as f:
+            f.write('set x = 1\nset name = "cached"\n')
+        
+        ConfigLang().load_file(path, enable_disk_cache=True)
+        inode = os.stat(cache_path).st_ino
+        cached = ConfigLang()
+        cached.load_file(path, enable_disk_cache=True)
+        if cached['x'] == 1 and cached['name'] == 'cached' and os.stat(cache_path).st_ino == inode:
+            print("✓ Cache hit restored the parsed state")
+        else:
+            print("✗ Cache hit failed")
+        
+        # A different size makes the header stale
+        with open(path, 'w') as f:
+            f.write('set x = 22\n')
+        stale = ConfigLang()
+        stale.load_file(path, enable_disk_cache=True)
+        if stale['x'] == 22 and 'name' not in stale and os.stat(cache_path).st_ino != inode:
+            print("✓ Stale cache was ignored and rewritten")
+        else:
+            print("✗ Stale cache was used")
+        
+        # Valid header, garbage snapshot
+        with open(cache_path, 'r+b') as f:
+            f.seek(_DISK_CACHE_HEADER.size)
+            f.write(b'garbage')
+            f.truncate()
+        corrupt = ConfigLang()
+        corrupt.load_file(path, enable_disk_cache=True)
+        if corrupt['x'] == 22:
+            print("✓ Corrupt cache fell back to parsing")
+        else:
+            print("✗ Corrupt cache was used")
+        
+        # A directory in the cache's place can be neither read nor replaced
+        os.remove(cache_path)
+        os.mkdir(cache_path)
+        unwritable = ConfigLang()
+        unwritable.load_file(path, enable_disk_cache=True)
+        if unwritable['x'] == 22 and sorted(os.listdir(tmp)) == ['cached.cfg', 'cached.cfg.cfgc']:
+            print("✓ Unwritable cache fell back to parsing without leftovers")
+        else:
+            print("✗ Unwritable cache failed")
+    
+    # Separate instances loading files in parallel threads
+    print(f"\nThreads:")
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(8):
+            path = os.path.join(tmp, f'thread_{i}.cfg')
+            with open(path, 'w') as f:
+                f.write(f'set id = {i}\nset name = "thread {i}"\n')
+            paths.append(path)
+        
+        def load(path):
+            cfg = ConfigLang()
+            cfg.load_file(path)
+            return cfg['id'], cfg['name']
+        
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(load, paths * 25))
+        if results == [(i, f"thread {i}") for i in range(8)] * 25:
+            print("✓ Parallel load_file calls kept their instances apart")
+        else:
+            print("✗ Parallel load_file calls mixed up results")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,120 @@
+# cython: language_level=3
+"""
+ConfigLang - optional compiled fast path for the hot accessors
+
+The ctypes wrapper in configlang.py converts every argument and result
+through ctypes on each call. This extension calls the same C functions
+directly through their addresses in the already loaded library, so it
+needs no headers or linking and works with any build of the library.
+
+It is used automatically by ConfigLang when it has been built; without it
+the package falls back to the pure ctypes implementation.
+"""
+
+from cpython.long cimport PyLong_Check, PyLong_AsUnsignedLongMask
+from libc.string cimport strlen
+
+
+cdef extern from "Python.h":
+    # Returns the UTF-8 form cached inside the str object (no allocation)
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t* size) except NULL
+
+
+# Variable types (matching C library)
+cdef enum:
+    CFG_TYPE_INT = 0
+
+ctypedef int (*get_int_t)(void* cfg, const char* name, int* out) nogil
+ctypedef int (*get_string_t)(void* cfg, const char* name, const char** out) nogil
+ctypedef int (*get_any_t)(void* cfg, const char* name, int* out_type,
+                          int* out_int, const char** out_str) nogil
+ctypedef int (*set_int_t)(void* cfg, const char* name, int value) nogil
+ctypedef const char* (*get_error_t)(void* cfg) nogil
+
+
+cdef class FastBinding:
+    """
+    Direct calls into one ConfigLang C instance.
+
+    Args:
+        cfg: Address of the C ConfigLang structure
+        get_int, get_string, get_any, set_int, get_error: Addresses of the
+            C functions (get_any may be 0 if the library lacks it)
+        ctypes_set_int: The ctypes function for cfg_set_int, used to convert
+            (or reject) set_int values that aren't ints exactly like ctypes
+        raise_error: Callable(error_code, raw_msg) that raises the matching
+            ConfigLangError
+    """
+
+    cdef void* cfg
+    cdef get_int_t c_get_int
+    cdef get_string_t c_get_string
+    cdef get_any_t c_get_any
+    cdef set_int_t c_set_int
+    cdef get_error_t c_get_error
+    cdef object ctypes_set_int
+    cdef object raise_error
+    cdef object __weakref__
+
+    def __init__(self, size_t cfg, size_t get_int, size_t get_string,
+                 size_t get_any, size_t set_int, size_t get_error,
+                 ctypes_set_int, raise_error):
+        self.cfg = <void*>cfg
+        self.c_get_int = <get_int_t>get_int
+        self.c_get_string = <get_string_t>get_string
+        self.c_get_any = <get_any_t>get_any
+        self.c_set_int = <set_int_t>set_int
+        self.c_get_error = <get_error_t>get_error
+        self.ctypes_set_int = ctypes_set_int
+        self.raise_error = raise_error
+
+    def close(self):
+        """Forget the C instance; later calls report a NULL pointer error"""
+        self.cfg = NULL
+
+    cdef int fail(self, int error_code) except -1:
+        cdef const char* msg = self.c_get_error(self.cfg)
+        self.raise_error(error_code, msg[:strlen(msg)])
+        return -1
+
+    def get_int(self, str name):
+        """Get the integer value of a variable"""
+        cdef int value
+        cdef int result = self.c_get_int(self.cfg, PyUnicode_AsUTF8AndSize(name, NULL), &value)
+        if result != 0:
+            self.fail(result)
+        return value
+
+    def get_string(self, str name):
+        """Get the string value of a variable"""
+        cdef const char* value
+        cdef int result = self.c_get_string(self.cfg, PyUnicode_AsUTF8AndSize(name, NULL), &value)
+        if result != 0:
+            self.fail(result)
+        return value[:strlen(value)].decode('utf-8')
+
+    def set_int(self, str name, value):
+        """Set the integer value of a variable"""
+        cdef int result
+        if PyLong_Check(value):
+            # Same wrap-around as ctypes' c_int conversion
+            result = self.c_set_int(self.cfg, PyUnicode_AsUTF8AndSize(name, NULL),
+                                    <int><long>PyLong_AsUnsignedLongMask(value))
+        else:
+            # Let ctypes accept (__index__) or reject (ArgumentError) the rest
+            result = self.ctypes_set_int(<size_t>self.cfg or None, name.encode('utf-8'), value)
+        if result != 0:
+            self.fail(result)
+
+    def get(self, str name):
+        """Get a variable value (auto-detects type), requires cfg_get_any"""
+        cdef int kind
+        cdef int int_value
+        cdef const char* str_value
+        cdef int result = self.c_get_any(self.cfg, PyUnicode_AsUTF8AndSize(name, NULL),
+                                         &kind, &int_value, &str_value)
+        if result != 0:
+            self.fail(result)
+        if kind == CFG_TYPE_INT:
+            return int_value
+        return str_value[:strlen(str_value)].decode('utf-8')
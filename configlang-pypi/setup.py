@@ -2,6 +2,19 @@ from setuptools import setup, Extension,find_packages
 import os
 import shutil
 
+# Optional compiled fast path for the hot accessors. The package works
+# without it (pure ctypes), so it is skipped when Cython is unavailable
+# and a failed compile doesn't fail the install.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        [Extension('configlang.configlang_fast', ['configlang/configlang_fast.pyx'], optional=True)],
+        language_level=3,
+    )
+
 
 setup(
     name='configlang',
@@ -13,6 +26,7 @@ setup(
     
 
     packages=find_packages(),
+    ext_modules=ext_modules,
     
     package_data={
      'configlang': ['*'],  
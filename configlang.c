@@ -17,10 +17,16 @@
 #define MAX_LINE_LENGTH 2048
 #define MAX_ERROR_MSG 256
 
+/* Snapshot format: magic, version, sizeof(int), variable count, then
+ * per variable: name length, name, type, const flag, value */
+#define SNAPSHOT_MAGIC "CFGS"
+#define SNAPSHOT_VERSION 1
+#define SNAPSHOT_HEADER_SIZE (4 + 2 + sizeof(int))
+
 /* Variable types */
 typedef enum {
-    VAR_TYPE_INT,
-    VAR_TYPE_STRING
+    VAR_TYPE_INT = CFG_TYPE_INT,
+    VAR_TYPE_STRING = CFG_TYPE_STRING
 } VarType;
 
 /* Variable storage */
@@ -124,10 +130,10 @@ static Variable* create_variable(ConfigLang* cfg, const char* name) {
  * LEXER
  * ======================================================================== */
 
-static void lexer_init(Lexer* lex, const char* input) {
+static void lexer_init(Lexer* lex, const char* input, size_t length) {
     lex->input = input;
     lex->pos = 0;
-    lex->length = strlen(input);
+    lex->length = length;
     lex->line_number = 1;
 }
 
@@ -170,6 +176,12 @@ static int lexer_read_multiline(Lexer* lex, Token* tok) {
         }
         
         char c = lexer_advance(lex);
+        
+        /* Files are read in binary mode: store CRLF line endings as LF */
+        if (c == '\r' && lexer_peek(lex) == '\n') {
+            continue;
+        }
+        
         dest[written++] = c;
     }
     
@@ -239,7 +251,7 @@ static Token lexer_next_token(Lexer* lex) {
     }
     
     /* Number */
-    if (isdigit(c) || (c == '-' && isdigit(lex->input[lex->pos + 1]))) {
+    if (isdigit(c) || (c == '-' && lex->pos + 1 < lex->length && isdigit(lex->input[lex->pos + 1]))) {
         size_t i = 0;
         if (c == '-') {
             tok.text[i++] = lexer_advance(lex);
@@ -652,8 +664,14 @@ void cfg_destroy(ConfigLang* cfg) {
 int cfg_load_string(ConfigLang* cfg, const char* code) {
     if (!cfg || !code) return ERR_CFG_NULL_POINTER;
     
+    return cfg_load_buffer(cfg, code, strlen(code));
+}
+
+int cfg_load_buffer(ConfigLang* cfg, const char* buf, size_t len) {
+    if (!cfg || !buf) return ERR_CFG_NULL_POINTER;
+    
     Lexer lex;
-    lexer_init(&lex, code);
+    lexer_init(&lex, buf, len);
     
     Parser parser;
     parser_init(&parser, &lex, cfg);
@@ -687,12 +705,17 @@ int cfg_load_file(ConfigLang* cfg, const char* path) {
     buffer[read] = '\0';
     fclose(f);
     
-    int result = cfg_load_string(cfg, buffer);
+    int result = cfg_load_buffer(cfg, buffer, read);
     free(buffer);
     
     return result;
 }
 
+int cfg_has(ConfigLang* cfg, const char* name) {
+    if (!cfg || !name) return 0;
+    return find_variable(cfg, name) != NULL;
+}
+
 int cfg_get_int(ConfigLang* cfg, const char* name, int* out) {
     if (!cfg || !name || !out) return ERR_CFG_NULL_POINTER;
     
@@ -729,6 +752,24 @@ int cfg_get_string(ConfigLang* cfg, const char* name, const char** out) {
     return ERR_CFG_OK;
 }
 
+int cfg_get_any(ConfigLang* cfg, const char* name, int* out_type, int* out_int, const char** out_str) {
+    if (!cfg || !name || !out_type || !out_int || !out_str) return ERR_CFG_NULL_POINTER;
+    
+    Variable* var = find_variable(cfg, name);
+    if (!var) {
+        set_error(cfg, ERR_CFG_VARIABLE_NOT_FOUND, "Variable not found", 0);
+        return ERR_CFG_VARIABLE_NOT_FOUND;
+    }
+    
+    *out_type = var->type;
+    if (var->type == VAR_TYPE_INT) {
+        *out_int = var->value.int_val;
+    } else {
+        *out_str = var->value.str_val;
+    }
+    return ERR_CFG_OK;
+}
+
 int cfg_set_int(ConfigLang* cfg, const char* name, int value) {
     if (!cfg || !name) return ERR_CFG_NULL_POINTER;
     
@@ -752,6 +793,171 @@ int cfg_set_int(ConfigLang* cfg, const char* name, int value) {
     return ERR_CFG_OK;
 }
 
+int cfg_set_string(ConfigLang* cfg, const char* name, const char* value) {
+    if (!cfg || !name || !value) return ERR_CFG_NULL_POINTER;
+    
+    Variable* var = find_variable(cfg, name);
+    if (!var) {
+        set_error(cfg, ERR_CFG_VARIABLE_NOT_FOUND, "Variable not found", 0);
+        return ERR_CFG_VARIABLE_NOT_FOUND;
+    }
+    
+    if (var->is_const) {
+        set_error(cfg, ERR_CFG_CONST_VIOLATION, "Cannot modify const variable", 0);
+        return ERR_CFG_CONST_VIOLATION;
+    }
+    
+    if (var->type != VAR_TYPE_STRING) {
+        set_error(cfg, ERR_CFG_TYPE_MISMATCH, "Variable is not a string", 0);
+        return ERR_CFG_TYPE_MISMATCH;
+    }
+    
+    size_t len = strlen(value);
+    if (len >= MAX_STRING_VALUE) {
+        set_error(cfg, ERR_CFG_OUT_OF_MEMORY, "String value too long", 0);
+        return ERR_CFG_OUT_OF_MEMORY;
+    }
+    
+    memcpy(var->value.str_val, value, len + 1);
+    return ERR_CFG_OK;
+}
+
+int cfg_get_many(ConfigLang* cfg, const char* names, int count,
+                 int* out_types, int* out_ints, const char** out_strs) {
+    if (!cfg || !names || !out_types || !out_ints || !out_strs) return ERR_CFG_NULL_POINTER;
+    
+    const char* name = names;
+    for (int i = 0; i < count; i++) {
+        Variable* var = find_variable(cfg, name);
+        if (!var) {
+            char msg[MAX_ERROR_MSG];
+            snprintf(msg, sizeof(msg), "Variable not found: %s", name);
+            set_error(cfg, ERR_CFG_VARIABLE_NOT_FOUND, msg, 0);
+            return ERR_CFG_VARIABLE_NOT_FOUND;
+        }
+        
+        out_types[i] = var->type;
+        if (var->type == VAR_TYPE_INT) {
+            out_ints[i] = var->value.int_val;
+            out_strs[i] = NULL;
+        } else {
+            out_ints[i] = 0;
+            out_strs[i] = var->value.str_val;
+        }
+        
+        name += strlen(name) + 1;
+    }
+    
+    return ERR_CFG_OK;
+}
+
+int cfg_set_many(ConfigLang* cfg, const char* names, int count, const int* values) {
+    if (!cfg || !names || !values) return ERR_CFG_NULL_POINTER;
+    
+    /* Validate every variable first so a failure leaves cfg untouched */
+    const char* name = names;
+    for (int i = 0; i < count; i++) {
+        Variable* var = find_variable(cfg, name);
+        char msg[MAX_ERROR_MSG];
+        if (!var) {
+            snprintf(msg, sizeof(msg), "Variable not found: %s", name);
+            set_error(cfg, ERR_CFG_VARIABLE_NOT_FOUND, msg, 0);
+            return ERR_CFG_VARIABLE_NOT_FOUND;
+        }
+        if (var->is_const) {
+            snprintf(msg, sizeof(msg), "Cannot modify const variable: %s", name);
+            set_error(cfg, ERR_CFG_CONST_VIOLATION, msg, 0);
+            return ERR_CFG_CONST_VIOLATION;
+        }
+        if (var->type != VAR_TYPE_INT) {
+            snprintf(msg, sizeof(msg), "Variable is not an integer: %s", name);
+            set_error(cfg, ERR_CFG_TYPE_MISMATCH, msg, 0);
+            return ERR_CFG_TYPE_MISMATCH;
+        }
+        name += strlen(name) + 1;
+    }
+    
+    name = names;
+    for (int i = 0; i < count; i++) {
+        find_variable(cfg, name)->value.int_val = values[i];
+        name += strlen(name) + 1;
+    }
+    
+    return ERR_CFG_OK;
+}
+
+int cfg_export(ConfigLang* cfg, CfgExport* out) {
+    if (!cfg || !out) return ERR_CFG_NULL_POINTER;
+    
+    memset(out, 0, sizeof(CfgExport));
+    
+    int count = 0;
+    size_t names_len = 0;
+    size_t strs_len = 0;
+    for (int i = 0; i < MAX_VARIABLES; i++) {
+        Variable* var = &cfg->variables[i];
+        if (!var->in_use) continue;
+        count++;
+        names_len += strlen(var->name) + 1;
+        if (var->type == VAR_TYPE_STRING) {
+            strs_len += strlen(var->value.str_val);
+        }
+    }
+    
+    /* +1 so that empty arrays are still valid allocations */
+    out->names = (char*)malloc(names_len + 1);
+    out->types = (int*)malloc((count + 1) * sizeof(int));
+    out->ints = (int*)malloc((count + 1) * sizeof(int));
+    out->str_offsets = (size_t*)malloc((count + 1) * sizeof(size_t));
+    out->strs = (char*)malloc(strs_len + 1);
+    if (!out->names || !out->types || !out->ints || !out->str_offsets || !out->strs) {
+        cfg_export_free(out);
+        set_error(cfg, ERR_CFG_OUT_OF_MEMORY, "Out of memory", 0);
+        return ERR_CFG_OUT_OF_MEMORY;
+    }
+    
+    char* name_out = out->names;
+    size_t str_pos = 0;
+    int n = 0;
+    for (int i = 0; i < MAX_VARIABLES; i++) {
+        Variable* var = &cfg->variables[i];
+        if (!var->in_use) continue;
+        
+        size_t name_len = strlen(var->name) + 1;
+        memcpy(name_out, var->name, name_len);
+        name_out += name_len;
+        
+        out->types[n] = var->type;
+        out->str_offsets[n] = str_pos;
+        if (var->type == VAR_TYPE_INT) {
+            out->ints[n] = var->value.int_val;
+        } else {
+            size_t str_len = strlen(var->value.str_val);
+            out->ints[n] = 0;
+            memcpy(out->strs + str_pos, var->value.str_val, str_len);
+            str_pos += str_len;
+        }
+        n++;
+    }
+    out->str_offsets[n] = str_pos;
+    
+    out->count = count;
+    out->names_len = names_len;
+    out->strs_len = strs_len;
+    return ERR_CFG_OK;
+}
+
+void cfg_export_free(CfgExport* exp) {
+    if (exp) {
+        free(exp->names);
+        free(exp->types);
+        free(exp->ints);
+        free(exp->str_offsets);
+        free(exp->strs);
+        memset(exp, 0, sizeof(CfgExport));
+    }
+}
+
 int cfg_save_file(ConfigLang* cfg, const char* path) {
     if (!cfg || !path) return ERR_CFG_NULL_POINTER;
     
@@ -791,4 +997,157 @@ int cfg_save_file(ConfigLang* cfg, const char* path) {
 const char* cfg_get_error(ConfigLang* cfg) {
     if (!cfg) return "NULL pointer";
     return cfg->error_msg;
-}
\ No newline at end of file
+}
+
+/* ========================================================================
+ * SNAPSHOTS
+ * ======================================================================== */
+
+static size_t snapshot_var_size(const Variable* var) {
+    size_t size = 1 + strlen(var->name) + 2;
+    if (var->type == VAR_TYPE_INT) {
+        size += sizeof(int);
+    } else {
+        size += sizeof(int) + strlen(var->value.str_val);
+    }
+    return size;
+}
+
+size_t cfg_snapshot_size(ConfigLang* cfg) {
+    if (!cfg) return 0;
+    
+    size_t size = SNAPSHOT_HEADER_SIZE;
+    for (int i = 0; i < MAX_VARIABLES; i++) {
+        if (cfg->variables[i].in_use) {
+            size += snapshot_var_size(&cfg->variables[i]);
+        }
+    }
+    return size;
+}
+
+int cfg_save_snapshot(ConfigLang* cfg, void* buf, size_t len) {
+    if (!cfg || !buf) return ERR_CFG_NULL_POINTER;
+    
+    if (len < cfg_snapshot_size(cfg)) {
+        set_error(cfg, ERR_CFG_OUT_OF_MEMORY, "Snapshot buffer too small", 0);
+        return ERR_CFG_OUT_OF_MEMORY;
+    }
+    
+    unsigned char* out = (unsigned char*)buf;
+    int count = 0;
+    for (int i = 0; i < MAX_VARIABLES; i++) {
+        if (cfg->variables[i].in_use) count++;
+    }
+    
+    memcpy(out, SNAPSHOT_MAGIC, 4);
+    out[4] = SNAPSHOT_VERSION;
+    out[5] = (unsigned char)sizeof(int);
+    memcpy(out + 6, &count, sizeof(int));
+    out += SNAPSHOT_HEADER_SIZE;
+    
+    for (int i = 0; i < MAX_VARIABLES; i++) {
+        Variable* var = &cfg->variables[i];
+        if (!var->in_use) continue;
+        
+        size_t name_len = strlen(var->name);
+        *out++ = (unsigned char)name_len;
+        memcpy(out, var->name, name_len);
+        out += name_len;
+        *out++ = (unsigned char)var->type;
+        *out++ = (unsigned char)var->is_const;
+        
+        if (var->type == VAR_TYPE_INT) {
+            memcpy(out, &var->value.int_val, sizeof(int));
+            out += sizeof(int);
+        } else {
+            int str_len = (int)strlen(var->value.str_val);
+            memcpy(out, &str_len, sizeof(int));
+            out += sizeof(int);
+            memcpy(out, var->value.str_val, str_len);
+            out += str_len;
+        }
+    }
+    
+    return ERR_CFG_OK;
+}
+
+int cfg_load_snapshot(ConfigLang* cfg, const void* buf, size_t len) {
+    if (!cfg || !buf) return ERR_CFG_NULL_POINTER;
+    
+    const unsigned char* in = (const unsigned char*)buf;
+    const unsigned char* end = in + len;
+    int count;
+    
+    if (len < SNAPSHOT_HEADER_SIZE ||
+        memcmp(in, SNAPSHOT_MAGIC, 4) != 0 ||
+        in[4] != SNAPSHOT_VERSION ||
+        in[5] != sizeof(int)) {
+        set_error(cfg, ERR_CFG_PARSE_ERROR, "Invalid snapshot", 0);
+        return ERR_CFG_PARSE_ERROR;
+    }
+    memcpy(&count, in + 6, sizeof(int));
+    in += SNAPSHOT_HEADER_SIZE;
+    
+    if (count < 0 || count > MAX_VARIABLES) {
+        set_error(cfg, ERR_CFG_PARSE_ERROR, "Invalid snapshot", 0);
+        return ERR_CFG_PARSE_ERROR;
+    }
+    
+    /* Validate the whole snapshot first so cfg is untouched on failure */
+    const unsigned char* p = in;
+    for (int i = 0; i < count; i++) {
+        if (end - p < 1) goto invalid;
+        size_t name_len = *p++;
+        if (name_len >= MAX_VAR_NAME || (size_t)(end - p) < name_len + 2 + sizeof(int)) goto invalid;
+        p += name_len;
+        
+        unsigned char type = *p;
+        p += 2;
+        if (type == VAR_TYPE_INT) {
+            p += sizeof(int);
+        } else if (type == VAR_TYPE_STRING) {
+            int str_len;
+            memcpy(&str_len, p, sizeof(int));
+            p += sizeof(int);
+            if (str_len < 0 || str_len >= MAX_STRING_VALUE || end - p < str_len) goto invalid;
+            p += str_len;
+        } else {
+            goto invalid;
+        }
+    }
+    
+    /* Then decode straight into cfg; slots past var_count were never used */
+    for (int i = 0; i < cfg->var_count; i++) {
+        cfg->variables[i].in_use = 0;
+    }
+    
+    for (int i = 0; i < count; i++) {
+        Variable* var = &cfg->variables[i];
+        
+        size_t name_len = *in++;
+        memcpy(var->name, in, name_len);
+        var->name[name_len] = '\0';
+        in += name_len;
+        
+        var->type = (VarType)*in++;
+        var->is_const = *in++;
+        if (var->type == VAR_TYPE_INT) {
+            memcpy(&var->value.int_val, in, sizeof(int));
+            in += sizeof(int);
+        } else {
+            int str_len;
+            memcpy(&str_len, in, sizeof(int));
+            in += sizeof(int);
+            memcpy(var->value.str_val, in, str_len);
+            var->value.str_val[str_len] = '\0';
+            in += str_len;
+        }
+        var->in_use = 1;
+    }
+    cfg->var_count = count;
+    return ERR_CFG_OK;
+
+invalid:
+    set_error(cfg, ERR_CFG_PARSE_ERROR, "Invalid snapshot", 0);
+    return ERR_CFG_PARSE_ERROR;
+}
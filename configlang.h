@@ -3,11 +3,17 @@
  * 
  * Embedded configuration and automation language library
  * Pure C99, no external dependencies
+ *
+ * The library has no global state: separate ConfigLang instances may be
+ * used from different threads at the same time. A single instance must not
+ * be used concurrently without external locking.
  */
 
 #ifndef CONFIGLANG_H
 #define CONFIGLANG_H
 
+#include <stddef.h>
+
 #ifdef __cplusplus
 extern "C" {
 #endif
@@ -23,9 +29,25 @@ extern "C" {
 #define ERR_CFG_TYPE_MISMATCH      -7
 #define ERR_CFG_UNKNOWN_ERROR      -8
 
+/* Variable types (reported by cfg_get_any and cfg_get_many) */
+#define CFG_TYPE_INT                0
+#define CFG_TYPE_STRING             1
+
 /* Opaque type - internal structure hidden */
 typedef struct ConfigLang ConfigLang;
 
+/* All variables as parallel arrays, filled by cfg_export */
+typedef struct {
+    int count;              /* number of variables */
+    char* names;            /* count names, each terminated by '\0' */
+    size_t names_len;       /* total size of names in bytes */
+    int* types;             /* CFG_TYPE_INT or CFG_TYPE_STRING per variable */
+    int* ints;              /* integer values (0 for strings) */
+    size_t* str_offsets;    /* count + 1 offsets into strs */
+    char* strs;             /* string values, concatenated without terminators */
+    size_t strs_len;        /* total size of strs in bytes */
+} CfgExport;
+
 /**
  * Create a new ConfigLang instance
  * Returns: pointer to ConfigLang or NULL on failure
@@ -49,6 +71,19 @@ int cfg_load_file(ConfigLang* cfg, const char* path);
  */
 int cfg_load_string(ConfigLang* cfg, const char* code);
 
+/**
+ * Load and execute configuration from a buffer of len bytes
+ * The buffer does not need to be NUL-terminated
+ * Returns: ERR_CFG_OK on success, error code otherwise
+ */
+int cfg_load_buffer(ConfigLang* cfg, const char* buf, size_t len);
+
+/**
+ * Check whether a variable exists
+ * Returns: 1 if it exists, 0 otherwise (never sets an error)
+ */
+int cfg_has(ConfigLang* cfg, const char* name);
+
 /**
  * Get integer value of a variable
  * Returns: ERR_CFG_OK on success, error code otherwise
@@ -62,18 +97,85 @@ int cfg_get_int(ConfigLang* cfg, const char* name, int* out);
  */
 int cfg_get_string(ConfigLang* cfg, const char* name, const char** out);
 
+/**
+ * Get the value of a variable of either type
+ * out_type: receives CFG_TYPE_INT or CFG_TYPE_STRING
+ * out_int: receives the integer value (unchanged for strings)
+ * out_str: receives the string value (unchanged for integers) - do not free
+ * Returns: ERR_CFG_OK on success, error code otherwise
+ */
+int cfg_get_any(ConfigLang* cfg, const char* name, int* out_type, int* out_int, const char** out_str);
+
 /**
  * Set integer value of a variable
  * Returns: ERR_CFG_OK on success, ERR_CFG_CONST_VIOLATION if variable is const
  */
 int cfg_set_int(ConfigLang* cfg, const char* name, int value);
 
+/**
+ * Set string value of a variable
+ * Returns: ERR_CFG_OK on success, ERR_CFG_CONST_VIOLATION if variable is const,
+ *          ERR_CFG_OUT_OF_MEMORY if value is longer than the internal limit (1023 bytes)
+ */
+int cfg_set_string(ConfigLang* cfg, const char* name, const char* value);
+
+/**
+ * Get several variables in one call
+ * names: count variable names, each terminated by '\0'
+ * out_types: receives CFG_TYPE_INT or CFG_TYPE_STRING for each variable
+ * out_ints: receives integer values (0 for strings)
+ * out_strs: receives string values (NULL for integers) - do not free
+ * Returns: ERR_CFG_OK on success, error code of the first failing lookup otherwise
+ */
+int cfg_get_many(ConfigLang* cfg, const char* names, int count,
+                 int* out_types, int* out_ints, const char** out_strs);
+
+/**
+ * Set several integer variables in one call
+ * names: count variable names, each terminated by '\0'
+ * Returns: ERR_CFG_OK on success, error code otherwise
+ * Note: no variable is modified unless all of them can be set
+ */
+int cfg_set_many(ConfigLang* cfg, const char* names, int count, const int* values);
+
+/**
+ * Export all variables into parallel arrays
+ * String i is strs[str_offsets[i]] up to strs[str_offsets[i + 1]]
+ * Returns: ERR_CFG_OK on success, error code otherwise
+ * Note: release the arrays with cfg_export_free
+ */
+int cfg_export(ConfigLang* cfg, CfgExport* out);
+
+/**
+ * Free the arrays allocated by cfg_export
+ */
+void cfg_export_free(CfgExport* exp);
+
 /**
  * Save current configuration state to a file
  * Returns: ERR_CFG_OK on success, error code otherwise
  */
 int cfg_save_file(ConfigLang* cfg, const char* path);
 
+/**
+ * Get the number of bytes needed to snapshot the current state
+ * Returns: snapshot size in bytes, 0 if cfg is NULL
+ */
+size_t cfg_snapshot_size(ConfigLang* cfg);
+
+/**
+ * Serialize all variables into buf (see cfg_snapshot_size)
+ * Returns: ERR_CFG_OK on success, ERR_CFG_OUT_OF_MEMORY if buf is too small
+ * Note: snapshots are only portable between builds of the same library
+ */
+int cfg_save_snapshot(ConfigLang* cfg, void* buf, size_t len);
+
+/**
+ * Replace all variables with the ones stored in a snapshot
+ * Returns: ERR_CFG_OK on success, ERR_CFG_PARSE_ERROR if the snapshot is invalid
+ */
+int cfg_load_snapshot(ConfigLang* cfg, const void* buf, size_t len);
+
 /**
  * Get last error message (useful for debugging)
  * Returns: pointer to error message string
@@ -6,7 +6,11 @@
 
 #include "configlang.h"
 #include <stdio.h>
+#include <stdlib.h>
 #include <string.h>
+#ifndef _WIN32
+#include <pthread.h>
+#endif
 
 void test_basic_variables(void) {
     printf("\n=== Test: Basic Variables ===\n");
@@ -269,6 +273,297 @@ void test_variable_reference(void) {
     cfg_destroy(cfg);
 }
 
+void test_load_buffer(void) {
+    printf("\n=== Test: Load Buffer ===\n");
+    
+    ConfigLang* cfg = cfg_create();
+    
+    /* Only the first line is inside the buffer, and it isn't NUL-terminated */
+    const char code[] = "set x = -5\nset y = 1";
+    int result = cfg_load_buffer(cfg, code, 10);
+    
+    int x, y;
+    cfg_get_int(cfg, "x", &x);
+    printf("x = %d\n", x);
+    
+    if (result == ERR_CFG_OK && cfg_get_int(cfg, "y", &y) == ERR_CFG_VARIABLE_NOT_FOUND) {
+        printf("✓ Stopped at the end of the buffer\n");
+    } else {
+        printf("✗ Read past the end of the buffer\n");
+    }
+    
+    cfg_destroy(cfg);
+}
+
+void test_set_string(void) {
+    printf("\n=== Test: Set String ===\n");
+    
+    ConfigLang* cfg = cfg_create();
+    cfg_load_string(cfg,
+        "set host = \"localhost\"\n"
+        "const set env = \"production\"\n"
+        "set port = 8080\n");
+    
+    const char* host;
+    if (cfg_set_string(cfg, "host", "example.com") == ERR_CFG_OK) {
+        cfg_get_string(cfg, "host", &host);
+        printf("✓ Successfully modified host to %s\n", host);
+    }
+    
+    if (cfg_set_string(cfg, "env", "dev") == ERR_CFG_CONST_VIOLATION) {
+        printf("✓ Correctly prevented modification of const variable\n");
+    }
+    
+    if (cfg_set_string(cfg, "port", "80") == ERR_CFG_TYPE_MISMATCH) {
+        printf("✓ Correctly rejected string for integer variable\n");
+    }
+    
+    /* Over-long values are rejected and leave the old value in place */
+    char long_value[2048];
+    memset(long_value, 'x', sizeof(long_value) - 1);
+    long_value[sizeof(long_value) - 1] = '\0';
+    if (cfg_set_string(cfg, "host", long_value) == ERR_CFG_OUT_OF_MEMORY &&
+        cfg_get_string(cfg, "host", &host) == ERR_CFG_OK &&
+        strcmp(host, "example.com") == 0) {
+        printf("✓ Correctly rejected over-long string value\n");
+    } else {
+        printf("✗ Over-long string value was not rejected\n");
+    }
+    
+    cfg_destroy(cfg);
+}
+
+void test_get_any(void) {
+    printf("\n=== Test: Get Any ===\n");
+    
+    ConfigLang* cfg = cfg_create();
+    cfg_load_string(cfg,
+        "set port = 8080\n"
+        "set host = \"localhost\"\n");
+    
+    int type, port;
+    const char* host;
+    
+    cfg_get_any(cfg, "port", &type, &port, &host);
+    if (type == CFG_TYPE_INT) {
+        printf("port = %d (int)\n", port);
+    }
+    
+    cfg_get_any(cfg, "host", &type, &port, &host);
+    if (type == CFG_TYPE_STRING) {
+        printf("host = %s (string)\n", host);
+    }
+    
+    if (cfg_get_any(cfg, "missing", &type, &port, &host) == ERR_CFG_VARIABLE_NOT_FOUND) {
+        printf("✓ Correctly reported missing variable\n");
+    }
+    
+    if (cfg_has(cfg, "port") && !cfg_has(cfg, "missing")) {
+        printf("✓ cfg_has reports existing variables only\n");
+    }
+    
+    cfg_destroy(cfg);
+}
+
+void test_snapshot(void) {
+    printf("\n=== Test: Snapshot ===\n");
+    
+    ConfigLang* cfg = cfg_create();
+    cfg_load_string(cfg,
+        "set port = 8080\n"
+        "const set max = 100\n"
+        "set host = \"localhost\"\n");
+    
+    size_t size = cfg_snapshot_size(cfg);
+    char* buf = (char*)malloc(size);
+    cfg_save_snapshot(cfg, buf, size);
+    
+    ConfigLang* copy = cfg_create();
+    int result = cfg_load_snapshot(copy, buf, size);
+    
+    int port;
+    const char* host;
+    cfg_get_int(copy, "port", &port);
+    cfg_get_string(copy, "host", &host);
+    printf("port = %d\n", port);
+    printf("host = %s\n", host);
+    
+    if (result == ERR_CFG_OK && cfg_set_int(copy, "max", 1) == ERR_CFG_CONST_VIOLATION) {
+        printf("✓ Snapshot restored values and const flags\n");
+    } else {
+        printf("✗ Snapshot restore failed\n");
+    }
+    
+    /* Truncated snapshots must be rejected, leaving the instance as it was */
+    if (cfg_load_snapshot(copy, buf, size - 1) == ERR_CFG_PARSE_ERROR &&
+        cfg_get_int(copy, "port", &port) == ERR_CFG_OK && port == 8080) {
+        printf("✓ Correctly rejected truncated snapshot\n");
+    } else {
+        printf("✗ Accepted truncated snapshot\n");
+    }
+    
+    /* Restoring replaces whatever the instance held before */
+    ConfigLang* other = cfg_create();
+    cfg_load_string(other, "set stale = 1\nset port = 1\n");
+    if (cfg_load_snapshot(other, buf, size) == ERR_CFG_OK &&
+        !cfg_has(other, "stale") &&
+        cfg_get_int(other, "port", &port) == ERR_CFG_OK && port == 8080) {
+        printf("✓ Snapshot replaced existing variables\n");
+    } else {
+        printf("✗ Snapshot left stale variables behind\n");
+    }
+    
+    free(buf);
+    cfg_destroy(other);
+    cfg_destroy(copy);
+    cfg_destroy(cfg);
+}
+
+void test_batch_access(void) {
+    printf("\n=== Test: Batch Access ===\n");
+    
+    ConfigLang* cfg = cfg_create();
+    cfg_load_string(cfg,
+        "set port = 8080\n"
+        "set host = \"localhost\"\n"
+        "const set max = 100\n");
+    
+    /* Names are '\0'-separated */
+    const char names[] = "port\0host\0max";
+    int types[3], ints[3];
+    const char* strs[3];
+    
+    cfg_get_many(cfg, names, 3, types, ints, strs);
+    printf("port = %d\n", ints[0]);
+    printf("host = %s\n", strs[1]);
+    printf("max = %d\n", ints[2]);
+    
+    /* Setting a const variable must leave the others untouched */
+    int values[2] = {9000, 1};
+    int result = cfg_set_many(cfg, "port\0max", 2, values);
+    int port;
+    cfg_get_int(cfg, "port", &port);
+    if (result == ERR_CFG_CONST_VIOLATION && port == 8080) {
+        printf("✓ Batch set rejected const variable without partial update\n");
+    } else {
+        printf("✗ Batch set applied a partial update\n");
+    }
+    
+    result = cfg_set_many(cfg, "port", 1, values);
+    cfg_get_int(cfg, "port", &port);
+    if (result == ERR_CFG_OK && port == 9000) {
+        printf("✓ Batch set updated port to %d\n", port);
+    }
+    
+    cfg_destroy(cfg);
+}
+
+void test_export(void) {
+    printf("\n=== Test: Export ===\n");
+    
+    ConfigLang* cfg = cfg_create();
+    cfg_load_string(cfg,
+        "set port = 8080\n"
+        "set host = \"localhost\"\n"
+        "set user = \"admin\"\n");
+    
+    CfgExport exp;
+    if (cfg_export(cfg, &exp) != ERR_CFG_OK) {
+        printf("✗ Export failed: %s\n", cfg_get_error(cfg));
+        cfg_destroy(cfg);
+        return;
+    }
+    
+    const char* name = exp.names;
+    for (int i = 0; i < exp.count; i++) {
+        if (exp.types[i] == CFG_TYPE_INT) {
+            printf("%s = %d\n", name, exp.ints[i]);
+        } else {
+            int len = (int)(exp.str_offsets[i + 1] - exp.str_offsets[i]);
+            printf("%s = %.*s\n", name, len, exp.strs + exp.str_offsets[i]);
+        }
+        name += strlen(name) + 1;
+    }
+    
+    cfg_export_free(&exp);
+    cfg_destroy(cfg);
+}
+
+#ifndef _WIN32
+#define PARALLEL_THREADS 4
+#define PARALLEL_ROUNDS 200
+
+static void* parallel_load_worker(void* arg) {
+    int id = *(int*)arg;
+    char path[64];
+    snprintf(path, sizeof(path), "test_parallel_%d.txt", id);
+    
+    FILE* f = fopen(path, "w");
+    if (!f) return (void*)1;
+    fprintf(f,
+        "set id = %d\n"
+        "set name = \"worker %d\"\n"
+        "set big = 0\n"
+        "if id > 1 { set big = 1 }\n", id, id);
+    fclose(f);
+    
+    char expected[32];
+    snprintf(expected, sizeof(expected), "worker %d", id);
+    
+    /* Each thread loads its own file into its own instance */
+    void* failed = NULL;
+    for (int round = 0; round < PARALLEL_ROUNDS && !failed; round++) {
+        ConfigLang* cfg = cfg_create();
+        int value, big;
+        const char* name;
+        
+        if (cfg_load_file(cfg, path) != ERR_CFG_OK ||
+            cfg_get_int(cfg, "id", &value) != ERR_CFG_OK || value != id ||
+            cfg_get_int(cfg, "big", &big) != ERR_CFG_OK || big != (id > 1) ||
+            cfg_get_string(cfg, "name", &name) != ERR_CFG_OK ||
+            strcmp(name, expected) != 0) {
+            failed = (void*)1;
+        }
+        cfg_destroy(cfg);
+    }
+    
+    remove(path);
+    return failed;
+}
+
+void test_parallel_load(void) {
+    printf("\n=== Test: Parallel Load ===\n");
+    
+    pthread_t threads[PARALLEL_THREADS];
+    int ids[PARALLEL_THREADS];
+    int started = 0;
+    int failed = 0;
+    
+    for (int i = 0; i < PARALLEL_THREADS; i++) {
+        ids[i] = i;
+        if (pthread_create(&threads[i], NULL, parallel_load_worker, &ids[i]) != 0) {
+            failed = 1;
+            break;
+        }
+        started++;
+    }
+    
+    for (int i = 0; i < started; i++) {
+        void* ret;
+        pthread_join(threads[i], &ret);
+        if (ret != NULL) {
+            failed = 1;
+        }
+    }
+    
+    if (!failed) {
+        printf("✓ %d threads loaded separate instances correctly\n", PARALLEL_THREADS);
+    } else {
+        printf("✗ Parallel load produced wrong results\n");
+    }
+}
+#endif
+
 int main(void) {
     printf("ConfigLang Library Test Suite\n");
     printf("==============================\n");
@@ -282,6 +577,15 @@ int main(void) {
     test_all_operators();
     test_variable_reference();
     test_save_load();
+    test_load_buffer();
+    test_get_any();
+    test_set_string();
+    test_snapshot();
+    test_batch_access();
+    test_export();
+#ifndef _WIN32
+    test_parallel_load();
+#endif
     
     printf("\n=== All Tests Complete ===\n");
     